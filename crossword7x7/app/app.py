@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+from typing import List
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if PROJECT_ROOT not in sys.path:
@@ -9,10 +10,10 @@ if PROJECT_ROOT not in sys.path:
 
 import streamlit as st
 
-from septago_crossword.geometry import build_grid_spec
+from septago_crossword.geometry import get_grid_spec
 from septago_crossword.puzzle_io import list_puzzles, load_puzzle, PuzzleValidationError
-from septago_crossword.engine import init_state, reduce, GridEvent, GameState
-from septago_crossword.ui_adapters import make_component_props
+from septago_crossword.engine import GRID_ORDER, init_state, reduce, GridEvent, GameState, grid_bar_letters
+from septago_crossword.ui_adapters import make_component_props_bytes
 from septago_crossword.component.crossword_grid import crossword_grid
 
 
@@ -36,35 +37,56 @@ The **intersection pool** shows the current letters at grid intersections (displ
 """
 
 
+@st.cache_resource
+def _grid_spec():
+    # Static geometry: one shared instance for all sessions.
+    return get_grid_spec()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_puzzles(puzzle_dir: str, mtime: float | None):
+    # mtime is only part of the cache key: adding/removing files bumps the
+    # directory mtime and forces a fresh listing; ttl picks up in-place edits.
+    return list_puzzles(puzzle_dir)
+
+
+def _dir_mtime(path: str) -> float | None:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
 def _ensure_state() -> None:
-    if "grid_spec" not in st.session_state:
-        st.session_state.grid_spec = build_grid_spec()
-
-    if "puzzle" not in st.session_state:
-        st.session_state.puzzle = None
-    if "game_state" not in st.session_state:
-        st.session_state.game_state = None
-    if "last_event_id" not in st.session_state:
-        st.session_state.last_event_id = None
-    if "show_instructions" not in st.session_state:
-        st.session_state.show_instructions = False
+    # Fast exit on every rerun after the first one in this session.
+    if st.session_state.get("_sept_inited"):
+        return
 
-    # Per-cell correctness marks (set by Check Word / Check Puzzle)
-    if "marks" not in st.session_state:
-        st.session_state.marks = {"grid": {}, "hidden": {}}
+    defaults = {
+        "grid_spec": _grid_spec(),
+        "puzzle": None,
+        "game_state": None,
+        "last_event_id": None,
+        "show_instructions": False,
+        # Per-cell correctness marks (set by Check Word / Check Puzzle)
+        "marks": {"grid": {}, "hidden": {}},
+    }
+    for k, v in defaults.items():
+        st.session_state.setdefault(k, v)
+    st.session_state._sept_inited = True
 
 
 def _get_bar_string(state: GameState, scope: str, bar_id: str) -> str:
     if scope == "hidden":
         arr = state.hidden_cells.get(bar_id, [])
     else:
-        arr = state.grid_cells.get(bar_id, [])  # type: ignore[arg-type]
+        arr = grid_bar_letters(state, st.session_state.grid_spec, bar_id)
     return "".join([ch or "" for ch in arr])
 
 
 def _get_hidden_answer(puzzle, bar_id: str) -> str:
     hidden = puzzle.answers.get("hidden", [])
-    if not isinstance(hidden, list):
+    if not isinstance(hidden, (list, tuple)):
         return ""
     # bar_id like hidden1/hidden2
     try:
@@ -76,22 +98,32 @@ def _get_hidden_answer(puzzle, bar_id: str) -> str:
     return ""
 
 
+# Answers are canonical uppercase A–Z (load_puzzle normalizes them) and the engine only
+# stores uppercase letters, so the checks below compare characters without case folding.
+
+
+def _bar_marks(arr, answer: str) -> List[str]:
+    """Per-cell "correct"/"wrong" marks for one bar's letters against its answer."""
+    got = "".join(ch or " " for ch in arr)
+    # Fast path: a fully and correctly filled bar is a single string compare.
+    if got == answer:
+        return ["correct"] * len(got)
+    out = ["correct" if g == a else "wrong" for g, a in zip(got, answer)]
+    out.extend(["wrong"] * (len(got) - len(out)))
+    return out
+
+
 def _check_word(puzzle, state: GameState) -> None:
     # Mark correctness for the *active* bar only (no banners).
     a = state.active
-    scope = a["scope"]
-    bar_id = a["bar_id"]
+    scope = a.scope
+    bar_id = a.bar_id
 
     if scope == "hidden":
         answer = _get_hidden_answer(puzzle, bar_id)
         if not answer:
             return
-        arr = list(state.hidden_cells.get(bar_id, []))
-        out = []
-        for i, ch in enumerate(arr):
-            expected = answer[i].upper() if i < len(answer) else ""
-            got = (ch or "").upper()
-            out.append("correct" if got and got == expected else "wrong")
+        out = _bar_marks(state.hidden_cells.get(bar_id, []), answer)
         st.session_state.marks = {"grid": {}, "hidden": {bar_id: out}}
         return
 
@@ -101,12 +133,9 @@ def _check_word(puzzle, state: GameState) -> None:
 
     grid_spec = st.session_state.grid_spec
     cells = grid_spec.bars.get(bar_id, [])
-    marks_grid = {}
-    for i, cell in enumerate(cells):
-        cid = f"{cell[0]},{cell[1]}"
-        got = (state.grid_cells.get(bar_id, [""])[i] or "").upper()
-        expected = answer[i].upper() if i < len(answer) else ""
-        marks_grid[cid] = "correct" if got and got == expected else "wrong"
+    cells_list = grid_bar_letters(state, grid_spec, bar_id)
+    ids = grid_spec.cell_id_strs
+    marks_grid = {ids[r][c]: mark for (r, c), mark in zip(cells, _bar_marks(cells_list, answer))}
     st.session_state.marks = {"grid": marks_grid, "hidden": {}}
 
 
@@ -114,40 +143,71 @@ def _check_puzzle(puzzle, state: GameState) -> None:
     # Mark correctness for *all* playable squares (grid + hidden).
     grid_spec = st.session_state.grid_spec
 
-    marks_grid = {}
-    for bid in ["h1", "h2", "h3", "v1", "v2", "v3"]:
-        ans = str(puzzle.answers.get(bid, "") or "")
-        if not ans:
-            continue
-        cells = grid_spec.bars.get(bid, [])
-        for i, cell in enumerate(cells):
-            cid = f"{cell[0]},{cell[1]}"
-            got = (state.grid_cells.get(bid, [""])[i] or "").upper()
-            expected = ans[i].upper() if i < len(ans) else ""
-            marks_grid[cid] = "correct" if got and got == expected else "wrong"
+    # One dict build over all bars; crossing cells take the later bar's mark, as before.
+    ids = grid_spec.cell_id_strs
+    answers = {bid: str(puzzle.answers.get(bid, "") or "") for bid in GRID_ORDER}
+    marks_grid = {
+        ids[r][c]: mark
+        for bid, ans in answers.items()
+        if ans
+        for (r, c), mark in zip(grid_spec.bars.get(bid, []), _bar_marks(grid_bar_letters(state, grid_spec, bid), ans))
+    }
 
     marks_hidden = {}
     for hid, arr in state.hidden_cells.items():
         ans = _get_hidden_answer(puzzle, hid)
         if not ans:
             continue
-        out = []
-        for i, ch in enumerate(arr):
-            expected = ans[i].upper() if i < len(ans) else ""
-            got = (ch or "").upper()
-            out.append("correct" if got and got == expected else "wrong")
-        marks_hidden[hid] = out
+        marks_hidden[hid] = _bar_marks(arr, ans)
 
     st.session_state.marks = {"grid": marks_grid, "hidden": marks_hidden}
 
 
+@st.fragment
+def _play_area(puzzle, grid_spec) -> None:
+    """Crossword component + event processing.
+
+    Runs as a fragment so component events (keystrokes, focus changes) rerun only
+    this block, not the sidebar/header. Fragment reruns replay the arguments of
+    the last full run, so live state is always read from st.session_state.
+    """
+    # Render the single unified component (includes its own clue list + reset button).
+    game_state = st.session_state.game_state
+    props = make_component_props_bytes(game_state, grid_spec, puzzle, marks=st.session_state.marks)
+    event = crossword_grid(props, key="crossword")
+
+    # Process component events (dedupe by event_id)
+    if isinstance(event, dict) and event.get("schema_version") == "crossword.v2":
+        ev_id = event.get("event_id")
+        if ev_id and ev_id != st.session_state.last_event_id:
+            st.session_state.last_event_id = ev_id
+            etype = event.get("type", "")
+            payload = event.get("payload", {}) or {}
+
+            # Ignore stale events from previous state_id
+            ev_state_id = payload.get("state_id")
+            cur_state_id = getattr(st.session_state.game_state, "state_id", None)
+            if ev_state_id is not None and cur_state_id is not None and ev_state_id != cur_state_id:
+                pass
+            else:
+                st.session_state.game_state = reduce(
+                    st.session_state.game_state,
+                    GridEvent(type=etype, payload=payload),
+                    grid_spec,
+                )
+
+                # Any edit invalidates prior check markings.
+                if etype in ("INPUT_LETTER", "BACKSPACE", "RESET"):
+                    st.session_state.marks = {"grid": {}, "hidden": {}}
+
+
 def main() -> None:
     st.set_page_config(page_title=APP_TITLE, page_icon="🧩", layout="wide")
     _ensure_state()
 
     grid_spec = st.session_state.grid_spec
     puzzle_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "puzzles")
-    metas = list_puzzles(puzzle_dir)
+    metas = _cached_puzzles(puzzle_dir, _dir_mtime(puzzle_dir))
 
     with st.sidebar:
         st.header("Puzzle")
@@ -214,6 +274,9 @@ def main() -> None:
     if subtitle:
         st.caption(subtitle)
 
+    # st.markdown only ships the source string; parsing/rendering happens in the
+    # browser, so there is no server-side render to cache. Keystrokes rerun only
+    # the _play_area fragment, so this block is not re-sent while typing either.
     if st.session_state.show_instructions:
         with st.expander("Instructions", expanded=True):
             st.markdown(instructions)
@@ -222,33 +285,8 @@ def main() -> None:
         st.info("Load a puzzle to start playing.")
         st.stop()
 
-    # Render the single unified component (includes its own clue list + reset button).
-    props = make_component_props(game_state, grid_spec, puzzle, marks=st.session_state.marks)
-    event = crossword_grid(props, key="crossword")
+    _play_area(puzzle, grid_spec)
 
-    # Process component events (dedupe by event_id)
-    if isinstance(event, dict) and event.get("schema_version") == "crossword.v2":
-        ev_id = event.get("event_id")
-        if ev_id and ev_id != st.session_state.last_event_id:
-            st.session_state.last_event_id = ev_id
-            etype = event.get("type", "")
-            payload = event.get("payload", {}) or {}
-
-            # Ignore stale events from previous state_id
-            ev_state_id = payload.get("state_id")
-            cur_state_id = getattr(st.session_state.game_state, "state_id", None)
-            if ev_state_id is not None and cur_state_id is not None and ev_state_id != cur_state_id:
-                pass
-            else:
-                st.session_state.game_state = reduce(
-                    st.session_state.game_state,
-                    GridEvent(type=etype, payload=payload),
-                    grid_spec,
-                )
-
-                # Any edit invalidates prior check markings.
-                if etype in ("INPUT_LETTER", "BACKSPACE", "RESET"):
-                    st.session_state.marks = {"grid": {}, "hidden": {}}
     # Apply check actions AFTER processing any pending grid events to avoid clobbering recent keystrokes.
     if check_word_clicked:
         _check_word(puzzle, st.session_state.game_state)
@@ -3,6 +3,8 @@ from __future__ import annotations
 from pathlib import Path
 import streamlit.components.v1 as components
 
+from ..._json import dumps_bytes
+
 _FRONTEND_DIR = (Path(__file__).parent / "frontend").resolve()
 _INDEX = _FRONTEND_DIR / "index.html"
 
@@ -18,5 +20,10 @@ _crossword_grid = components.declare_component(
     path=_FRONTEND_DIR.as_posix(),
 )
 
-def crossword_grid(props: dict, key: str = "crossword_grid"):
-    return _crossword_grid(props=props, key=key, default=None)
\ No newline at end of file
+def crossword_grid(props: dict | bytes, key: str = "crossword_grid"):
+    # Props are sent as one pre-serialized JSON bytes arg: Streamlit ships bytes args
+    # as-is (binary special arg) instead of running stdlib json.dumps over the whole
+    # props tree on every rerun. The frontend decodes and parses `props_json`.
+    # Already-serialized props (make_component_props_bytes) are passed through.
+    props_json = props if isinstance(props, (bytes, bytearray)) else dumps_bytes(props)
+    return _crossword_grid(props_json=props_json, key=key, default=None)
\ No newline at end of file
@@ -973,7 +973,9 @@
 
     if (type === "streamlit:render") {
       let props = null;
-      if (msg.args && msg.args.props) props = msg.args.props;
+      // Server sends props as pre-serialized JSON bytes (Uint8Array).
+      if (msg.args && msg.args.props_json) props = JSON.parse(new TextDecoder("utf-8").decode(msg.args.props_json));
+      else if (msg.args && msg.args.props) props = msg.args.props;
       else if (msg.args && msg.args.args && msg.args.args.props) props = msg.args.args.props;
       else if (Array.isArray(msg.args) && msg.args[0] && msg.args[0].props) props = msg.args[0].props;
       else if (msg.props) props = msg.props;
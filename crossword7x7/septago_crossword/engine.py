@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import itertools
 import time
 import uuid
 from dataclasses import dataclass, replace
-from typing import Dict, List, Literal, TypedDict
+from typing import Callable, Dict, List, Literal, Sequence, Tuple, TypedDict
 
-from .geometry import GridSpec, GridBarId
+from .geometry import EMPTY_CELL, GridSpec, GridBarId
 from .puzzle_io import Puzzle
 
 
@@ -23,7 +24,8 @@ class BarRef(TypedDict):
     length: int
 
 
-class ActiveRef(TypedDict):
+@dataclass(frozen=True, slots=True)
+class ActiveRef:
     scope: BarScope
     bar_id: str
     index: int
@@ -49,16 +51,32 @@ class GridEvent:
 
 @dataclass(frozen=True)
 class GameState:
+    """One game's state; ``reduce()`` returns the next one.
+
+    Frozen fields, but not a snapshot: successive states share ``grid_bytes`` and
+    ``hidden_cells``, which ``reduce()`` edits in place. Once a state has been
+    passed to ``reduce()``, only use the returned state; do not render or compare
+    the earlier one. The props memo in ui_adapters relies on this (it matches
+    states by identity).
+    """
+
     puzzle_id: str
     state_id: str  # unique per init/reset (forces frontend resync)
 
-    grid_cells: Dict[GridBarId, List[str]]
-    hidden_cells: Dict[str, List[str]]
+    # Letter storage is owned by the state and edited in place by the reducer.
+    #
+    # grid_bytes is the whole size×size grid, row-major (see GridSpec.bar_flat_indices):
+    # EMPTY_CELL for an empty playable cell, BLOCK_CELL for a black cell, else ASCII A–Z.
+    # Crossing bars share the same byte, so intersections are linked for free.
+    # hidden_cells values are immutable tuples; an edit swaps in a new tuple for its bar.
+    grid_bytes: bytearray
+    hidden_cells: Dict[str, Tuple[str, ...]]
 
     active: ActiveRef
     clue_order: List[BarRef]
 
-    start_time: float
+    # Game start in whole seconds since the Unix epoch
+    start_time_epoch: int
 
     # Highest client_seq processed so far (frontend uses this to ignore stale renders)
     last_client_seq: int = 0
@@ -67,75 +85,92 @@ class GameState:
 
 GRID_ORDER: List[GridBarId] = ["h1", "h2", "h3", "v1", "v2", "v3"]
 
+# state_id only has to be unique (it is a frontend resync token): a per-process
+# prefix plus a counter avoids drawing a fresh uuid4 on every init/reset.
+_STATE_ID_PREFIX = uuid.uuid4().hex[:8]
+_STATE_ID = itertools.count(1)
+
+
+def _new_state_id() -> str:
+    return f"{_STATE_ID_PREFIX}-s{next(_STATE_ID)}"
+
+
+_BAR_DIR: Dict[str, Direction] = {
+    "h1": "horizontal",
+    "h2": "horizontal",
+    "h3": "horizontal",
+    "v1": "vertical",
+    "v2": "vertical",
+    "v3": "vertical",
+}
+
 
 def _bar_direction(bar_id: str) -> Direction:
-    if bar_id in ("h1", "h2", "h3"):
-        return "horizontal"
-    if bar_id in ("v1", "v2", "v3"):
-        return "vertical"
-    return "horizontal"
+    return _BAR_DIR.get(bar_id, "horizontal")
 
 
-def _first_empty_index(cells: List[str]) -> int:
+def _first_empty_index(cells: Sequence[str] | Sequence[int]) -> int:
+    # Works for letter lists ("" = empty) and grid bytes (EMPTY_CELL = 0).
     for i, ch in enumerate(cells):
-        if (ch or "") == "":
+        if not ch:
             return i
     return 0
 
 
+def grid_bar_letters(state: GameState, grid: GridSpec, bar_id: str) -> List[str]:
+    """Letters of one grid bar, in bar order ("" for empty cells)."""
+    buf = state.grid_bytes
+    return [chr(buf[i]) if buf[i] else "" for i in grid.bar_flat_indices.get(bar_id, ())]  # type: ignore[arg-type]
+
+
 def derive_intersection_letters(state: GameState, grid: GridSpec) -> List[str]:
     out: List[str] = []
+    buf = state.grid_bytes
     for (bar_id, idx) in grid.intersections:
-        val = state.grid_cells.get(bar_id, [""])[idx]
-        out.append(val or "")
+        val = buf[grid.bar_flat_indices[bar_id][idx]]
+        out.append(chr(val) if val else "")
     return out
 
 
 def is_complete(state: GameState) -> bool:
-    all_grid = all(all((ch or "") != "" for ch in state.grid_cells[bid]) for bid in state.grid_cells)
-    all_hidden = all(all((ch or "") != "" for ch in arr) for arr in state.hidden_cells.values())
-    return bool(all_grid and all_hidden)
+    # Black cells hold BLOCK_CELL, so any EMPTY_CELL byte is an unfilled square;
+    # both membership tests run as C-level scans.
+    if EMPTY_CELL in state.grid_bytes:
+        return False
+    return all("" not in arr for arr in state.hidden_cells.values())
 
 
 def init_state(puzzle: Puzzle, grid: GridSpec) -> GameState:
-    # Initialize empty grid cells
-    grid_cells: Dict[GridBarId, List[str]] = {bid: ["" for _ in range(grid.bar_lengths[bid])] for bid in GRID_ORDER}
+    # Initialize empty grid cells (black cells hold BLOCK_CELL)
+    grid_bytes = bytearray(grid.empty_grid_bytes)
 
     # Hidden bars are driven by puzzle.answers.hidden (1 or 2 strings)
     hidden_answers = puzzle.answers.get("hidden", [])
-    if not isinstance(hidden_answers, list) or not hidden_answers:
+    if not isinstance(hidden_answers, (list, tuple)) or not hidden_answers:
         hidden_answers = [""]
 
-    hidden_cells: Dict[str, List[str]] = {}
+    hidden_cells: Dict[str, Tuple[str, ...]] = {}
     for i, word in enumerate(hidden_answers, start=1):
         hid = f"hidden{i}"
-        hidden_cells[hid] = ["" for _ in range(len(str(word)))]
+        hidden_cells[hid] = ("",) * len(str(word))
 
     # Clue order: grid order then hidden bars
-    clue_order: List[BarRef] = [
-        {"scope": "grid", "bar_id": bid, "length": int(grid.bar_lengths[bid])}
-        for bid in GRID_ORDER
-    ]
+    clue_order: List[BarRef] = list(grid.clue_order_grid)  # type: ignore[arg-type]
     for hid, arr in hidden_cells.items():
         clue_order.append({"scope": "hidden", "bar_id": hid, "length": len(arr)})
 
     # Default active: first grid bar (h1) at first empty
-    active: ActiveRef = {
-        "scope": "grid",
-        "bar_id": "h1",
-        "index": 0,
-        "direction": "horizontal",
-    }
+    active = ActiveRef(scope="grid", bar_id="h1", index=0, direction="horizontal")
 
     puzzle_id = str((puzzle.meta or {}).get("id", puzzle.filename))
     return GameState(
         puzzle_id=puzzle_id,
-        state_id=str(uuid.uuid4()),
-        grid_cells=grid_cells,
+        state_id=_new_state_id(),
+        grid_bytes=grid_bytes,
         hidden_cells=hidden_cells,
         active=active,
         clue_order=clue_order,
-        start_time=time.time(),
+        start_time_epoch=int(time.time()),
         last_client_seq=0,
         last_action="init",
     )
@@ -146,8 +181,28 @@ def init_state(puzzle: Puzzle, grid: GridSpec) -> GameState:
 # -----------------------------
 
 
+# Event type -> handler(state, payload, grid). Names resolve at call time, so the
+# handlers can be defined further down.
+_HANDLERS: Dict[str, Callable[[GameState, dict, GridSpec], GameState]] = {
+    "INPUT_LETTER": lambda s, p, g: _on_input_letter(s, p, g),
+    "MOVE_NEXT": lambda s, p, g: _on_move(s, g, step=1),
+    "MOVE_PREV": lambda s, p, g: _on_move(s, g, step=-1),
+    "SET_ACTIVE_BAR": lambda s, p, g: _on_set_active(s, p, g),
+    "BACKSPACE": lambda s, p, g: _on_backspace(s, g),
+    "RESET": lambda s, p, g: _on_reset(s, g),
+    "TICK": lambda s, p, g: s,
+}
+
+
 def reduce(state: GameState, event: GridEvent, grid: GridSpec) -> GameState:
-    """Authoritative state transition (server-side)."""
+    """Authoritative state transition (server-side).
+
+    Letter edits write into ``state.grid_bytes`` / ``state.hidden_cells`` in place
+    (no per-keystroke copies of the grid), so ``state`` is stale afterwards; the
+    returned GameState carries the updated active/bookkeeping.
+    Events that change nothing (cursor at an edge, invalid input, unknown types)
+    return ``state`` itself, so callers can detect no-ops with an ``is`` check.
+    """
     payload = event.payload or {}
     client_seq = payload.get("client_seq")
     try:
@@ -156,22 +211,11 @@ def reduce(state: GameState, event: GridEvent, grid: GridSpec) -> GameState:
         client_seq_int = None
 
     t = event.type
-    if t == "INPUT_LETTER":
-        out = _on_input_letter(state, payload, grid)
-    elif t == "MOVE_NEXT":
-        out = _on_move(state, step=1)
-    elif t == "MOVE_PREV":
-        out = _on_move(state, step=-1)
-    elif t == "SET_ACTIVE_BAR":
-        out = _on_set_active(state, payload)
-    elif t == "BACKSPACE":
-        out = _on_backspace(state, grid)
-    elif t == "RESET":
-        out = _on_reset(state)
-    elif t == "TICK":
-        out = state
+    handler = _HANDLERS.get(t)
+    if handler is not None:
+        out = handler(state, payload, grid)
     else:
-        out = replace(state, last_action=f"ignored:{t}")
+        out = state  # unknown event type: ignored
 
     if client_seq_int is not None and client_seq_int > out.last_client_seq:
         out = replace(out, last_client_seq=client_seq_int)
@@ -182,7 +226,7 @@ def _clamp(i: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, i))
 
 
-def _on_set_active(state: GameState, payload: dict) -> GameState:
+def _on_set_active(state: GameState, payload: dict, grid: GridSpec) -> GameState:
     scope = str(payload.get("scope", "grid"))
     bar_id = str(payload.get("bar_id", "h1"))
     idx_raw = payload.get("index", None)
@@ -191,14 +235,14 @@ def _on_set_active(state: GameState, payload: dict) -> GameState:
         scope = "grid"
 
     if scope == "grid":
-        if bar_id not in state.grid_cells:
+        if bar_id not in grid.bar_flat_indices:
             bar_id = "h1"
-        cells = state.grid_cells[bar_id]  # type: ignore[index]
+        cells = [state.grid_bytes[i] for i in grid.bar_flat_indices[bar_id]]  # type: ignore[index]
         direction = _bar_direction(bar_id)
     else:
         if bar_id not in state.hidden_cells:
             bar_id = next(iter(state.hidden_cells.keys()), "hidden1")
-        cells = state.hidden_cells.get(bar_id, [])
+        cells = state.hidden_cells.get(bar_id, ())
         direction = "horizontal"
 
     if idx_raw is None:
@@ -210,82 +254,69 @@ def _on_set_active(state: GameState, payload: dict) -> GameState:
             idx = 0
         idx = _clamp(idx, 0, max(0, len(cells) - 1))
 
-    new_active: ActiveRef = {
-        "scope": scope,  # type: ignore[assignment]
-        "bar_id": bar_id,
-        "index": idx,
-        "direction": direction,
-    }
+    new_active = ActiveRef(scope=scope, bar_id=bar_id, index=idx, direction=direction)  # type: ignore[arg-type]
 
+    if new_active == state.active:
+        return state  # no-op: already active
     return replace(state, active=new_active, last_action="set_active")
 
 
-def _on_move(state: GameState, step: int) -> GameState:
+def _on_move(state: GameState, grid: GridSpec, step: int) -> GameState:
     a = state.active
-    scope = a["scope"]
-    bar_id = a["bar_id"]
-    idx = int(a["index"])
+    scope = a.scope
+    bar_id = a.bar_id
+    idx = a.index
 
     if scope == "grid":
-        cells = state.grid_cells.get(bar_id, [])  # type: ignore[arg-type]
+        length = grid.bar_lengths.get(bar_id, 0)  # type: ignore[arg-type]
     else:
-        cells = state.hidden_cells.get(bar_id, [])
+        length = len(state.hidden_cells.get(bar_id, ()))
 
-    if not cells:
-        return replace(state, last_action="move:empty")
+    if not length:
+        return state  # no-op: move:empty
 
-    nxt = _clamp(idx + step, 0, len(cells) - 1)
+    nxt = _clamp(idx + step, 0, length - 1)
     if nxt == idx:
-        return replace(state, last_action="move:edge")
+        return state  # no-op: move:edge
 
-    new_active = dict(a)
-    new_active["index"] = nxt
-    return replace(state, active=new_active, last_action="move")
+    return replace(state, active=replace(a, index=nxt), last_action="move")
 
 
 def _on_input_letter(state: GameState, payload: dict, grid: GridSpec) -> GameState:
     letter = str(payload.get("letter", "")).upper().strip()
     if len(letter) != 1 or not ("A" <= letter <= "Z"):
-        return replace(state, last_action="input:ignored")
+        return state  # no-op: input:ignored
 
     a = state.active
-    scope = a["scope"]
-    bar_id = a["bar_id"]
-    idx = int(a["index"])
+    scope = a.scope
+    bar_id = a.bar_id
+    idx = a.index
 
     if scope == "hidden":
         if bar_id not in state.hidden_cells:
-            return replace(state, last_action="input:hidden_missing")
-        arr = list(state.hidden_cells[bar_id])
+            return state  # no-op: input:hidden_missing
+        arr = state.hidden_cells[bar_id]
         if idx < 0 or idx >= len(arr):
-            return replace(state, last_action="input:oob")
-        arr[idx] = letter
-        new_hidden = dict(state.hidden_cells)
-        new_hidden[bar_id] = arr
-        out = replace(state, hidden_cells=new_hidden, last_action="input:hidden")
-        return _on_move(out, step=1)
-
-    # Grid
-    if bar_id not in state.grid_cells:
-        return replace(state, last_action="input:grid_missing")
-    arr = list(state.grid_cells[bar_id])  # type: ignore[arg-type]
-    if idx < 0 or idx >= len(arr):
-        return replace(state, last_action="input:oob")
-    arr[idx] = letter
-    new_grid = dict(state.grid_cells)
-    new_grid[bar_id] = arr  # type: ignore[index]
-
-    # Cross-link at intersections
-    key = (bar_id, idx)  # type: ignore[arg-type]
-    if key in grid.cross_map:
-        other_bar, other_idx = grid.cross_map[key]
-        other_arr = list(new_grid.get(other_bar, [""] * grid.bar_lengths[other_bar]))
-        if 0 <= other_idx < len(other_arr):
-            other_arr[other_idx] = letter
-            new_grid[other_bar] = other_arr
-
-    out = replace(state, grid_cells=new_grid, last_action="input:grid")
-    return _on_move(out, step=1)
+            return state  # no-op: input:oob
+        state.hidden_cells[bar_id] = arr[:idx] + (letter,) + arr[idx + 1 :]
+        return _advance_after_input(state, idx, len(arr))
+
+    # Grid (crossing bars share the byte, so no explicit cross-link write)
+    flat = grid.bar_flat_indices.get(bar_id)  # type: ignore[arg-type]
+    if flat is None:
+        return state  # no-op: input:grid_missing
+    if idx < 0 or idx >= len(flat):
+        return state  # no-op: input:oob
+    state.grid_bytes[flat[idx]] = ord(letter)
+    return _advance_after_input(state, idx, len(flat))
+
+
+def _advance_after_input(state: GameState, idx: int, length: int) -> GameState:
+    # Record the edit and step the cursor in a single transition (one replace).
+    nxt = _clamp(idx + 1, 0, length - 1)
+    if nxt == idx:
+        return replace(state, last_action="move:edge")
+    return replace(state, active=replace(state.active, index=nxt), last_action="move")
 
 
 def _on_backspace(state: GameState, grid: GridSpec) -> GameState:
@@ -293,100 +324,71 @@ def _on_backspace(state: GameState, grid: GridSpec) -> GameState:
     Backspace behavior:
     - If current cell has a letter: clear it.
     - Else (already empty): move back one cell and clear that.
-    - For grid intersections: clear partner cell too (same behavior).
+    - For grid intersections the partner cell is the same byte, so it clears too.
     """
     a = state.active
-    scope = a["scope"]
-    bar_id = a["bar_id"]
-    idx = int(a["index"])
+    scope = a.scope
+    bar_id = a.bar_id
+    idx = a.index
 
     if scope == "hidden":
         if bar_id not in state.hidden_cells:
-            return replace(state, last_action="bksp:hidden_missing")
-        arr = list(state.hidden_cells[bar_id])
+            return state  # no-op: bksp:hidden_missing
+        arr = state.hidden_cells[bar_id]
         if not arr:
-            return replace(state, last_action="bksp:hidden_empty")
+            return state  # no-op: bksp:hidden_empty
 
         idx = _clamp(idx, 0, len(arr) - 1)
 
         if (arr[idx] or "") != "":
-            arr[idx] = ""
-            new_hidden = dict(state.hidden_cells)
-            new_hidden[bar_id] = arr
-            return replace(state, hidden_cells=new_hidden, last_action="bksp:hidden_clear")
+            state.hidden_cells[bar_id] = arr[:idx] + ("",) + arr[idx + 1 :]
+            return replace(state, last_action="bksp:hidden_clear")
 
         if idx > 0:
             idx2 = idx - 1
-            arr[idx2] = ""
-            new_hidden = dict(state.hidden_cells)
-            new_hidden[bar_id] = arr
-            new_active = dict(a)
-            new_active["index"] = idx2
-            return replace(state, hidden_cells=new_hidden, active=new_active, last_action="bksp:hidden_prev_clear")
+            state.hidden_cells[bar_id] = arr[:idx2] + ("",) + arr[idx2 + 1 :]
+            return replace(state, active=replace(a, index=idx2), last_action="bksp:hidden_prev_clear")
 
-        return replace(state, last_action="bksp:hidden_edge")
+        return state  # no-op: bksp:hidden_edge
 
     # grid
-    if bar_id not in state.grid_cells:
-        return replace(state, last_action="bksp:grid_missing")
-    arr = list(state.grid_cells[bar_id])  # type: ignore[arg-type]
-    if not arr:
-        return replace(state, last_action="bksp:grid_empty")
-
-    idx = _clamp(idx, 0, len(arr) - 1)
-
-    def clear_at(b: GridBarId, i: int, grid_cells: Dict[GridBarId, List[str]]) -> Dict[GridBarId, List[str]]:
-        out = dict(grid_cells)
-        a2 = list(out.get(b, [""] * grid.bar_lengths[b]))
-        if 0 <= i < len(a2):
-            a2[i] = ""
-            out[b] = a2
-        return out
-
-    def clear_with_partner(b: GridBarId, i: int, grid_cells: Dict[GridBarId, List[str]]) -> Dict[GridBarId, List[str]]:
-        out = clear_at(b, i, grid_cells)
-        key = (b, i)
-        if key in grid.cross_map:
-            ob, oi = grid.cross_map[key]
-            out = clear_at(ob, oi, out)
-        return out
+    flat = grid.bar_flat_indices.get(bar_id)  # type: ignore[arg-type]
+    if flat is None:
+        return state  # no-op: bksp:grid_missing
+    if not flat:
+        return state  # no-op: bksp:grid_empty
+
+    idx = _clamp(idx, 0, len(flat) - 1)
+    buf = state.grid_bytes
 
     # if current has a letter, clear it
-    if (arr[idx] or "") != "":
-        new_grid = clear_with_partner(bar_id, idx, state.grid_cells)  # type: ignore[arg-type]
-        return replace(state, grid_cells=new_grid, last_action="bksp:grid_clear")
+    if buf[flat[idx]] != EMPTY_CELL:
+        buf[flat[idx]] = EMPTY_CELL
+        return replace(state, last_action="bksp:grid_clear")
 
     # else move back one and clear there
     if idx > 0:
         idx2 = idx - 1
-        new_grid = clear_with_partner(bar_id, idx2, state.grid_cells)  # type: ignore[arg-type]
-        new_active = dict(a)
-        new_active["index"] = idx2
-        return replace(state, grid_cells=new_grid, active=new_active, last_action="bksp:grid_prev_clear")
+        buf[flat[idx2]] = EMPTY_CELL
+        return replace(state, active=replace(a, index=idx2), last_action="bksp:grid_prev_clear")
 
-    return replace(state, last_action="bksp:grid_edge")
+    return state  # no-op: bksp:grid_edge
 
 
-def _on_reset(state: GameState) -> GameState:
+def _on_reset(state: GameState, grid: GridSpec) -> GameState:
     # Clear all cells, reset timer, keep puzzle_id.
-    new_grid = {bid: ["" for _ in arr] for bid, arr in state.grid_cells.items()}
-    new_hidden = {hid: ["" for _ in arr] for hid, arr in state.hidden_cells.items()}
+    state.grid_bytes[:] = grid.empty_grid_bytes
+    new_hidden = {hid: ("",) * len(arr) for hid, arr in state.hidden_cells.items()}
 
     # Reset active to first bar
-    new_active: ActiveRef = {
-        "scope": "grid",
-        "bar_id": "h1",
-        "index": 0,
-        "direction": "horizontal",
-    }
+    new_active = ActiveRef(scope="grid", bar_id="h1", index=0, direction="horizontal")
 
     return replace(
         state,
-        state_id=str(uuid.uuid4()),
-        grid_cells=new_grid,  # type: ignore[arg-type]
+        state_id=_new_state_id(),
         hidden_cells=new_hidden,
         active=new_active,
-        start_time=time.time(),
+        start_time_epoch=int(time.time()),
         last_client_seq=0,
         last_action="reset",
     )
\ No newline at end of file
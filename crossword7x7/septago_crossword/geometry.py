@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Literal
+from typing import Dict, FrozenSet, List, Tuple, Literal
 
 # --- Types ---
 
@@ -10,6 +10,10 @@ Cell = Tuple[int, int]
 # Grid bars (7×7 Septago): 3 horizontals, 3 verticals.
 GridBarId = Literal["h1", "h2", "h3", "v1", "v2", "v3"]
 
+# Byte values used by flat grid letter storage (see GridSpec.empty_grid_bytes).
+EMPTY_CELL = 0
+BLOCK_CELL = ord("#")
+
 
 @dataclass(frozen=True)
 class GridSpec:
@@ -40,6 +44,31 @@ class GridSpec:
 
     bar_lengths: Dict[GridBarId, int]
 
+    # Bar -> row-major flat index (r * size + c) of each cell, for flat letter storage.
+    bar_flat_indices: Dict[GridBarId, Tuple[int, ...]]
+
+    # Precomputed "r,c" cell id strings, indexed [r][c].
+    cell_id_strs: List[List[str]]
+
+    # Row-major (r, c, cell id, playable) for every cell; position == flat index.
+    flat_cells: Tuple[Tuple[int, int, str, bool], ...]
+
+    # Bar -> frozenset of its cells (membership tests for highlighting)
+    bar_cell_sets: Dict[GridBarId, FrozenSet[Cell]]
+
+    # JSON-ready payloads for the frontend (shared; read-only):
+    # bar -> ordered cell ids, cross_map as "bar_id:index" -> "bar_id:index",
+    # and the intersection pool as cell ids in canonical order.
+    bars_payload: Dict[GridBarId, List[str]]
+    cross_map_payload: Dict[str, str]
+    intersection_cell_ids: Tuple[str, ...]
+
+    # Row-major template of an empty grid: EMPTY_CELL for playable cells, BLOCK_CELL otherwise.
+    empty_grid_bytes: bytes
+
+    # Grid part of a game's clue order ({"scope", "bar_id", "length"} refs, shared; read-only).
+    clue_order_grid: Tuple[Dict[str, object], ...]
+
 
 def build_grid_spec() -> GridSpec:
     """Build fixed 7×7 Septago geometry.
@@ -59,6 +88,16 @@ def build_grid_spec() -> GridSpec:
             row.append((r in playable_rows) or (c in playable_cols))
         playable_mask.append(row)
 
+    cell_id_strs: List[List[str]] = [[f"{r},{c}" for c in range(size)] for r in range(size)]
+
+    flat_cells = tuple(
+        (r, c, cell_id_strs[r][c], playable_mask[r][c]) for r in range(size) for c in range(size)
+    )
+
+    empty_grid_bytes = bytes(
+        EMPTY_CELL if playable else BLOCK_CELL for row in playable_mask for playable in row
+    )
+
     bars: Dict[GridBarId, List[Cell]] = {
         "h1": [(1, c) for c in range(size)],
         "h2": [(3, c) for c in range(size)],
@@ -92,6 +131,22 @@ def build_grid_spec() -> GridSpec:
 
     bar_lengths = {bid: len(cells) for bid, cells in bars.items()}
 
+    bar_flat_indices: Dict[GridBarId, Tuple[int, ...]] = {
+        bid: tuple(r * size + c for (r, c) in cells) for bid, cells in bars.items()
+    }
+
+    clue_order_grid = tuple(
+        {"scope": "grid", "bar_id": bid, "length": length} for bid, length in bar_lengths.items()
+    )
+
+    bar_cell_sets: Dict[GridBarId, FrozenSet[Cell]] = {bid: frozenset(cells) for bid, cells in bars.items()}
+
+    bars_payload: Dict[GridBarId, List[str]] = {
+        bid: [cell_id_strs[r][c] for (r, c) in cells] for bid, cells in bars.items()
+    }
+    cross_map_payload = {f"{a}:{i}": f"{b}:{j}" for (a, i), (b, j) in cross_map.items()}
+    intersection_cell_ids = tuple(bars_payload[bid][idx] for (bid, idx) in intersections)
+
     return GridSpec(
         size=size,
         playable_mask=playable_mask,
@@ -100,6 +155,15 @@ def build_grid_spec() -> GridSpec:
         cross_map=cross_map,
         intersections=intersections,
         bar_lengths=bar_lengths,
+        bar_flat_indices=bar_flat_indices,
+        cell_id_strs=cell_id_strs,
+        flat_cells=flat_cells,
+        bar_cell_sets=bar_cell_sets,
+        bars_payload=bars_payload,
+        cross_map_payload=cross_map_payload,
+        intersection_cell_ids=intersection_cell_ids,
+        empty_grid_bytes=empty_grid_bytes,
+        clue_order_grid=clue_order_grid,
     )
 
 
@@ -116,3 +180,12 @@ def first_playable_cell(grid: GridSpec) -> Cell:
             if grid.playable_mask[r][c]:
                 return (r, c)
     raise RuntimeError("No playable cells in grid")
+
+
+# The geometry is static and identical for every session, so build it once at import.
+_GRID_SPEC_SINGLETON: GridSpec = build_grid_spec()
+
+
+def get_grid_spec() -> GridSpec:
+    """Return the shared, process-wide GridSpec (treat as read-only)."""
+    return _GRID_SPEC_SINGLETON
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import os
+import string
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, TypedDict
 
+from ._json import loads as _json_loads
 from .geometry import GridSpec, GridBarId
 
 
@@ -12,20 +13,26 @@ class PuzzleValidationError(ValueError):
     pass
 
 
+_DROP_SPACE = str.maketrans("", "", " ")
+
+
 def _norm_letters(s: str) -> str:
-    return "".join(ch for ch in str(s).upper().strip() if ch != " ")
+    return str(s).strip().upper().translate(_DROP_SPACE)
+
+
+# Deletes A–Z: whatever survives translate() is invalid.
+_NON_AZ = str.maketrans("", "", string.ascii_uppercase)
 
 
 def _validate_letters_only(s: str) -> None:
-    for ch in s:
-        if "A" <= ch <= "Z":
-            continue
+    bad = s.translate(_NON_AZ)
+    if bad:
         raise PuzzleValidationError(
-            f"Invalid character '{ch}' in string '{s}'. Only A–Z allowed."
+            f"Invalid character '{bad[0]}' in string '{s}'. Only A–Z allowed."
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PuzzleMeta:
     id: str
     title: str
@@ -43,7 +50,7 @@ class PuzzleAnswers(TypedDict, total=False):
     v1: str
     v2: str
     v3: str
-    hidden: List[str]
+    hidden: Tuple[str, ...]
 
 
 class PuzzleClues(TypedDict, total=False):
@@ -53,10 +60,10 @@ class PuzzleClues(TypedDict, total=False):
     v1: str
     v2: str
     v3: str
-    hidden: List[str]
+    hidden: Tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Puzzle:
     schema_version: str
     meta: dict
@@ -65,30 +72,47 @@ class Puzzle:
     filename: str
 
 
+# path -> ((st_mtime_ns, st_size), PuzzleMeta); re-parse a file only when it changes.
+_META_CACHE: Dict[str, Tuple[Tuple[int, int], PuzzleMeta]] = {}
+
+
+def _read_meta(path: str, fn: str) -> PuzzleMeta:
+    # Full parse on purpose: puzzle files are ~1–2 KB, "meta" is not guaranteed to be
+    # the first key (schema_version usually is), and _META_CACHE means each file is
+    # parsed once per change. A streaming parser (ijson) would not pay for itself here.
+    with open(path, "rb") as f:
+        raw = _json_loads(f.read())
+    meta = raw.get("meta", {}) or {}
+    return PuzzleMeta(
+        id=str(meta.get("id", fn.replace(".json", ""))),
+        title=str(meta.get("title", fn.replace(".json", ""))),
+        subtitle=str(meta.get("subtitle", "")),
+        author=str(meta.get("author", "")),
+        date=str(meta.get("date", "")),
+        difficulty=str(meta.get("difficulty", "")),
+        filename=fn,
+    )
+
+
 def list_puzzles(puzzle_dir: str) -> List[PuzzleMeta]:
     metas: List[PuzzleMeta] = []
     if not os.path.isdir(puzzle_dir):
         return metas
 
-    for fn in sorted(os.listdir(puzzle_dir)):
-        if not fn.lower().endswith(".json"):
-            continue
-        path = os.path.join(puzzle_dir, fn)
+    with os.scandir(puzzle_dir) as it:
+        entries = sorted((e for e in it if e.name.lower().endswith(".json")), key=lambda e: e.name)
+
+    for entry in entries:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            meta = raw.get("meta", {}) or {}
-            metas.append(
-                PuzzleMeta(
-                    id=str(meta.get("id", fn.replace(".json", ""))),
-                    title=str(meta.get("title", fn.replace(".json", ""))),
-                    subtitle=str(meta.get("subtitle", "")),
-                    author=str(meta.get("author", "")),
-                    date=str(meta.get("date", "")),
-                    difficulty=str(meta.get("difficulty", "")),
-                    filename=fn,
-                )
-            )
+            st = entry.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+            cached = _META_CACHE.get(entry.path)
+            if cached is not None and cached[0] == stamp:
+                metas.append(cached[1])
+                continue
+            pm = _read_meta(entry.path, entry.name)
+            _META_CACHE[entry.path] = (stamp, pm)
+            metas.append(pm)
         except Exception:
             continue
     return metas
@@ -111,8 +135,8 @@ def load_puzzle(path: str, grid: GridSpec) -> Puzzle:
     }
     """
 
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    with open(path, "rb") as f:
+        raw = _json_loads(f.read())
 
     schema_version = str(raw.get("schema_version", "")).strip()
     if schema_version != "puzzlefile.v2":
@@ -157,8 +181,8 @@ def load_puzzle(path: str, grid: GridSpec) -> Puzzle:
         hidden_norm.append(hw_s)
 
     # Validate clues (non-empty for grid; hidden clues length matches hidden bars, but can be blank strings)
-    for bid in required_grid:
-        clue = str(clues_raw.get(bid, "")).strip()
+    canonical_clues = {bid: str(clues_raw.get(bid, "")).strip() for bid in required_grid}
+    for bid, clue in canonical_clues.items():
         if not clue:
             raise PuzzleValidationError(f"clues.{bid} missing non-empty string")
 
@@ -170,10 +194,10 @@ def load_puzzle(path: str, grid: GridSpec) -> Puzzle:
 
     # Build canonical dicts
     answers: Dict[str, object] = {bid: _norm_letters(answers_raw[bid]) for bid in required_grid}
-    answers["hidden"] = hidden_norm
+    answers["hidden"] = tuple(hidden_norm)
 
-    clues: Dict[str, object] = {bid: str(clues_raw.get(bid, "")).strip() for bid in required_grid}
-    clues["hidden"] = [str(x).strip() for x in hidden_clues]
+    clues: Dict[str, object] = dict(canonical_clues)
+    clues["hidden"] = tuple(str(x).strip() for x in hidden_clues)
 
     return Puzzle(
         schema_version=schema_version,
@@ -1,23 +1,44 @@
 from __future__ import annotations
 
+import threading
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
+from ._json import dumps_bytes
 from .engine import GameState, is_complete
-from .geometry import GridSpec, Cell
+from .geometry import EMPTY_CELL, GridSpec
 from .puzzle_io import Puzzle
 
 
-def cell_id(cell: Cell) -> str:
-    return f"{cell[0]},{cell[1]}"
+# Last props built per game, keyed by state_id:
+# state_id -> (state, grid, puzzle, marks, props).
+_PROPS_MEMO: Dict[str, Tuple[Any, ...]] = {}
+_PROPS_MEMO_MAX = 64
+_PROPS_MEMO_LOCK = threading.Lock()
 
+# Last serialized props per game: state_id -> (state, grid, puzzle, marks, second, bytes).
+# The wall-clock second is part of the key because status.elapsed_seconds changes with it.
+_PROPS_BYTES_MEMO: Dict[str, Tuple[Any, ...]] = {}
 
-def _cell_letter_from_state(state: GameState, grid: GridSpec, cell: Cell) -> str:
-    pos = grid.cell_to_positions.get(cell, [])
-    if not pos:
-        return ""
-    bar_id, idx = pos[0]
-    return state.grid_cells.get(bar_id, [""])[idx] or ""
+# Grid/puzzle-only props parts: (id(grid), id(puzzle), hidden ids) -> (grid, puzzle, parts).
+_STATIC_PROPS: Dict[Tuple[int, int, Tuple[str, ...]], Tuple[GridSpec, Puzzle, Dict[str, Any]]] = {}
+
+
+def _bounded_put(cache: Dict[Any, Any], key: Any, value: Any) -> None:
+    """Store ``value`` under ``key``, evicting the oldest entry once ``cache`` is full."""
+    with _PROPS_MEMO_LOCK:
+        if key not in cache and len(cache) >= _PROPS_MEMO_MAX:
+            cache.pop(next(iter(cache)), None)
+        cache[key] = value
+
+
+def _status_payload(state: GameState, complete: bool) -> Dict[str, Any]:
+    start_time_epoch = state.start_time_epoch
+    return {
+        "complete": complete,
+        "elapsed_seconds": max(0, int(time.time()) - start_time_epoch),
+        "start_time_epoch": start_time_epoch,
+    }
 
 
 def make_component_props(
@@ -26,55 +47,114 @@ def make_component_props(
     puzzle: Puzzle,
     marks: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
-    """Build props for the unified crossword.v2 component."""
-
-    # Grid cell payload (still cell-based for rendering simplicity)
-    cells_payload: List[Dict[str, Any]] = []
-    for r in range(grid.size):
-        for c in range(grid.size):
-            playable = grid.playable_mask[r][c]
-            cell = (r, c)
-            is_black = not playable
-            letter = _cell_letter_from_state(state, grid, cell) if playable else ""
-
-            # Active highlight only when scope == grid
-            active_cell = False
-            active_slot = False
-            if playable and state.active["scope"] == "grid":
-                ab = state.active["bar_id"]
-                ai = int(state.active["index"])
-                if ab in grid.bars and 0 <= ai < len(grid.bars[ab]):
-                    active_cell = (grid.bars[ab][ai] == cell)
-                active_slot = cell in set(grid.bars.get(ab, []))
-
-            cells_payload.append(
-                {
-                    "id": cell_id(cell),
-                    "r": r,
-                    "c": c,
-                    "is_black": is_black,
-                    "is_playable": playable,
-                    "letter": letter,
-                    "highlight": {
-                        "active_cell": active_cell,
-                        "active_slot": active_slot,
-                    },
-                }
-            )
-
-    # Bar geometry for JS local-first navigation
-    bars_payload: Dict[str, List[str]] = {bid: [cell_id(c) for c in cells] for bid, cells in grid.bars.items()}
-
-    # cross_map: encode keys as "bar_id:index" strings for JSON
-    cross_payload: Dict[str, str] = {
-        f"{a[0]}:{a[1]}": f"{b[0]}:{b[1]}" for a, b in grid.cross_map.items()
+    """Build props for the unified crossword.v2 component.
+
+    Props are memoized per game and reused while the state object, the grid,
+    the puzzle and the marks object are all unchanged (e.g. reruns triggered by
+    unrelated widgets). Only the timer fields are refreshed.
+    """
+    # Identity is enough: a state is never rendered again once reduce() has edited it (see GameState).
+    hit = _PROPS_MEMO.get(state.state_id)
+    if hit is not None:
+        m_state, m_grid, m_puzzle, m_marks, props = hit
+        if m_state is state and m_grid is grid and m_puzzle is puzzle and m_marks is marks:
+            return dict(props, status=_status_payload(state, props["status"]["complete"]))
+
+    props = _build_component_props(state, grid, puzzle, marks)
+    _bounded_put(_PROPS_MEMO, state.state_id, (state, grid, puzzle, marks, props))
+    return props
+
+
+def make_component_props_bytes(
+    state: GameState,
+    grid: GridSpec,
+    puzzle: Puzzle,
+    marks: Dict[str, Any] | None = None,
+) -> bytes:
+    """make_component_props() serialized to UTF-8 JSON bytes, ready for the component.
+
+    Repeated calls within the same second for an unchanged game (idle reruns)
+    return the previously serialized bytes without rebuilding anything.
+    """
+    now = int(time.time())
+    hit = _PROPS_BYTES_MEMO.get(state.state_id)
+    if hit is not None:
+        m_state, m_grid, m_puzzle, m_marks, m_now, data = hit
+        if m_now == now and m_state is state and m_grid is grid and m_puzzle is puzzle and m_marks is marks:
+            return data
+
+    data = dumps_bytes(make_component_props(state, grid, puzzle, marks=marks))
+    _bounded_put(_PROPS_BYTES_MEMO, state.state_id, (state, grid, puzzle, marks, now, data))
+    return data
+
+
+def _static_props(grid: GridSpec, puzzle: Puzzle, hidden_order: Tuple[str, ...]) -> Dict[str, Any]:
+    """Props parts that depend only on the grid geometry and the puzzle.
+
+    Cached per (grid, puzzle, hidden bar ids) and shared between props dicts, so
+    treat the returned structures as read-only.
+    """
+    key = (id(grid), id(puzzle), hidden_order)
+    hit = _STATIC_PROPS.get(key)
+    # Entries keep grid/puzzle alive, so a matching id is never a recycled object.
+    if hit is not None and hit[0] is grid and hit[1] is puzzle:
+        return hit[2]
+
+    # Clues: pass to JS for local-first clicking.
+    clues: Dict[str, Any] = dict(puzzle.clues)
+    hidden_clues = clues.get("hidden", [])
+    if isinstance(hidden_clues, (list, tuple)):
+        for i, hid in enumerate(hidden_order):
+            clues[hid] = hidden_clues[i] if i < len(hidden_clues) else ""
+
+    static = {
+        # Bar geometry and cross_map for JS local-first navigation (precomputed on GridSpec)
+        "bars": grid.bars_payload,
+        "cross_map": grid.cross_map_payload,
+        "bar_order": ["h1", "h2", "h3", "v1", "v2", "v3"],
+        "hidden_order": list(hidden_order),
+        "clues": clues,
     }
+    _bounded_put(_STATIC_PROPS, key, (grid, puzzle, static))
+    return static
+
+
+def _build_component_props(
+    state: GameState,
+    grid: GridSpec,
+    puzzle: Puzzle,
+    marks: Dict[str, Any] | None,
+) -> Dict[str, Any]:
+
+    # Active highlight only when scope == grid; resolved once, not per cell.
+    a = state.active
+    ab_bar = grid.bars.get(a.bar_id, ()) if a.scope == "grid" else ()  # type: ignore[arg-type]
+    active_cell_target = ab_bar[a.index] if 0 <= a.index < len(ab_bar) else None
+    active_slot_set = grid.bar_cell_sets.get(a.bar_id, frozenset()) if ab_bar else frozenset()  # type: ignore[arg-type]
+
+    # Grid cell payload (still cell-based for rendering simplicity).
+    # Black cells hold BLOCK_CELL in grid_bytes, so the letter is gated on playable.
+    buf = state.grid_bytes
+    cells_payload: List[Dict[str, Any]] = [
+        {
+            "id": cid,
+            "r": r,
+            "c": c,
+            "is_black": not playable,
+            "is_playable": playable,
+            "letter": chr(buf[i]) if playable and buf[i] != EMPTY_CELL else "",
+            "highlight": {
+                "active_cell": (r, c) == active_cell_target,
+                "active_slot": (r, c) in active_slot_set,
+            },
+        }
+        for i, (r, c, cid, playable) in enumerate(grid.flat_cells)
+    ]
 
-    # Intersection pool now sends ordered CELL IDs (JS derives letters from local gridLetters)
-    intersection_cells: List[str] = []
-    for (bar_id, idx) in grid.intersections:
-        cell = grid.bars[bar_id][idx]
-        intersection_cells.append(cell_id(cell))
+    # Bars, cross_map, intersection pool, bar orders and clues (cached per grid/puzzle)
+    # init_state inserts hidden1, hidden2, ... in order, so no sort is needed for the cache key.
+    hidden_order = tuple(state.hidden_cells)
+    static = _static_props(grid, puzzle, hidden_order)
 
     # Hidden bars payload
     hidden_payload: Dict[str, Any] = {}
@@ -82,52 +162,42 @@ def make_component_props(
         hidden_payload[hid] = {
             "id": hid,
             "length": len(arr),
-            "letters": list(arr),
+            "letters": arr,
         }
 
-    # Clues: pass to JS for local-first clicking.
-    clues: Dict[str, Any] = dict(puzzle.clues)
-    hidden_clues = clues.get("hidden", [])
-    if isinstance(hidden_clues, list):
-        for i, hid in enumerate(sorted(state.hidden_cells.keys())):
-            clues[hid] = hidden_clues[i] if i < len(hidden_clues) else ""
-
     complete = is_complete(state)
 
-    # Timer
-    now = time.time()
-    elapsed = int(max(0.0, now - float(state.start_time)))
-    start_time_epoch = int(float(state.start_time))
-
     return {
         "schema_version": "crossword.v2.props",
         "grid": {
             "size": grid.size,
             "cells": cells_payload,
-            "bars": bars_payload,
-            "cross_map": cross_payload,
-            "bar_order": ["h1", "h2", "h3", "v1", "v2", "v3"],
+            "bars": static["bars"],
+            "cross_map": static["cross_map"],
+            "bar_order": static["bar_order"],
         },
         "hidden": {
             "bars": hidden_payload,
-            "bar_order": sorted(state.hidden_cells.keys()),
+            "bar_order": static["hidden_order"],
         },
         "intersection_pool": {
-            "cells": intersection_cells,
+            # Ordered CELL IDs (JS derives letters from local gridLetters)
+            "cells": grid.intersection_cell_ids,
         },
-        "clues": clues,
+        "clues": static["clues"],
         "focus": {
-            "active": dict(state.active),
-        },
-        "status": {
-            "complete": complete,
-            "elapsed_seconds": elapsed,
-            "start_time_epoch": start_time_epoch,
+            "active": {
+                "scope": a.scope,
+                "bar_id": a.bar_id,
+                "index": a.index,
+                "direction": a.direction,
+            },
         },
+        "status": _status_payload(state, complete),
         "sync": {
-            "last_client_seq": int(getattr(state, "last_client_seq", 0)),
-            "puzzle_id": getattr(state, "puzzle_id", ""),
-            "state_id": getattr(state, "state_id", ""),
+            "last_client_seq": state.last_client_seq,
+            "puzzle_id": state.puzzle_id,
+            "state_id": state.state_id,
         },
         "marks": marks or {"grid": {}, "hidden": {}},
     }
\ No newline at end of file
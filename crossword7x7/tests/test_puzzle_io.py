@@ -0,0 +1,26 @@
+import unittest
+
+from septago_crossword.puzzle_io import (
+    PuzzleValidationError,
+    _norm_letters,
+    _validate_letters_only,
+)
+
+
+class NormLettersTest(unittest.TestCase):
+    def test_trailing_non_breaking_space_is_trimmed(self):
+        self.assertEqual(_norm_letters("abc\xa0"), "ABC")
+        _validate_letters_only(_norm_letters("ABC\xa0"))
+
+    def test_inner_spaces_are_dropped(self):
+        self.assertEqual(_norm_letters(" a b c "), "ABC")
+
+    def test_embedded_tab_is_rejected(self):
+        ans = _norm_letters(" AB\tC ")
+        self.assertEqual(ans, "AB\tC")
+        with self.assertRaises(PuzzleValidationError):
+            _validate_letters_only(ans)
+
+
+if __name__ == "__main__":
+    unittest.main()